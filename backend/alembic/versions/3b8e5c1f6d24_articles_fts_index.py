@@ -0,0 +1,40 @@
+"""Add a GIN full-text index over article title/summary/content.
+
+Backs the chat keyword search: a single tsvector @@ tsquery match probes
+this index instead of running stacked ILIKE predicates as a sequential
+scan. PostgreSQL only — the SQLite dev path keeps its ILIKE fallback.
+
+Revision ID: 3b8e5c1f6d24
+Revises: 7c41d9b2a5f0
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e5c1f6d24"
+down_revision: Union[str, None] = "7c41d9b2a5f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Queries must reproduce this exact expression to hit the index.
+FTS_EXPRESSION = (
+    "to_tsvector('english', coalesce(title,'') || ' ' || "
+    "coalesce(summary,'') || ' ' || coalesce(content,''))"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS articles_fts_idx "
+            f"ON articles USING GIN ({FTS_EXPRESSION})"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS articles_fts_idx")
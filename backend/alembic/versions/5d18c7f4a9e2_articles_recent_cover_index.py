@@ -0,0 +1,39 @@
+"""Add a covering index for the recent-articles listing.
+
+show_database.py (and any "latest articles" view) orders by
+discovered_date DESC and reads six display columns for the top 10 rows.
+With the displayed columns in the INCLUDE list the query becomes an
+index-only scan of 10 tuples instead of a full-table sort. PostgreSQL
+only — SQLite has neither INCLUDE nor the table sizes to need it.
+
+Revision ID: 5d18c7f4a9e2
+Revises: 9f72a4e8c3b1
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d18c7f4a9e2"
+down_revision: Union[str, None] = "9f72a4e8c3b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS articles_recent_cover_idx "
+            "ON articles (discovered_date DESC) "
+            "INCLUDE (title, category, county, source, priority_score, analyzed)"
+        )
+        # Refresh stats so the planner picks the new index right away
+        op.execute("ANALYZE articles")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS articles_recent_cover_idx")
@@ -0,0 +1,53 @@
+"""Initial schema — consolidates the ad-hoc setup scripts.
+
+Replaces setup_postgres_schema.setup_schema(), setup_watchlist_schema, and
+the implicit Base.metadata.create_all() calls scattered through the seeders
+with one tracked revision. Tables come straight from the ORM models so the
+models stay the single source of truth; Alembic emits dialect-appropriate
+DDL, removing the hand-maintained PG/SQLite branches.
+
+Revision ID: 7c41d9b2a5f0
+Revises:
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.database import Base
+from app import models  # noqa: F401  (registers tables on Base.metadata)
+
+# revision identifiers, used by Alembic.
+revision: str = "7c41d9b2a5f0"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Secondary indexes previously created by setup_watchlist_schema.py.
+# Plain CREATE INDEX here (not CONCURRENTLY) — this revision runs inside
+# Alembic's transaction, and at initial-schema time the tables are empty.
+WATCHLIST_INDEXES = [
+    ("idx_watched_matters_matter_id", "watched_matters", "matter_id"),
+    ("idx_watched_matters_active", "watched_matters", "is_active"),
+    ("idx_matter_histories_matter_id", "matter_histories", "matter_id"),
+    ("idx_matter_histories_action_date", "matter_histories", "action_date DESC"),
+    ("idx_matter_attachments_matter_id", "matter_attachments", "matter_id"),
+    ("idx_matter_votes_matter_id", "matter_votes", "matter_id"),
+    ("idx_matter_votes_date", "matter_votes", "vote_date DESC"),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # checkfirst keeps this revision safe to stamp over databases the old
+    # scripts already built.
+    Base.metadata.create_all(bind=bind, checkfirst=True)
+    for name, table, cols in WATCHLIST_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({cols})")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    Base.metadata.drop_all(bind=bind)
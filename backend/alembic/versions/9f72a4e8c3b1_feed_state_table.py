@@ -0,0 +1,34 @@
+"""Add feed_state for conditional RSS fetches.
+
+Stores each feed's last ETag/Last-Modified so the RSS scraper can issue
+conditional GETs and skip download + parse entirely when a feed responds
+304 Not Modified.
+
+Revision ID: 9f72a4e8c3b1
+Revises: 3b8e5c1f6d24
+Create Date: 2026-08-30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9f72a4e8c3b1"
+down_revision: Union[str, None] = "3b8e5c1f6d24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feed_state",
+        sa.Column("feed_url", sa.String(1000), primary_key=True),
+        sa.Column("etag", sa.String(500)),
+        sa.Column("last_modified", sa.String(100)),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("feed_state")
@@ -12,53 +12,73 @@ async def analyze_articles():
     db = SessionLocal()
     ai_service = AIService()
     
-    # Get unanalyzed articles
-    articles = db.query(Article).filter(Article.analyzed == False).all()
-    
-    if not articles:
+    # Count server-side; rows are then fetched in fixed-size batches so
+    # resident memory stays bounded regardless of backlog size. Since each
+    # processed article flips analyzed=True, re-querying with LIMIT
+    # naturally advances through the backlog (windowed paging is safer here
+    # than a streaming cursor, which a mid-iteration commit would break).
+    total = db.query(Article).filter(Article.analyzed == False).count()
+
+    if not total:
         print("\n✅ No unanalyzed articles found.")
         db.close()
         return
-    
+
     print(f"\n{'='*80}")
-    print(f"ANALYZING {len(articles)} ARTICLES WITH GPT-4O-MINI")
+    print(f"ANALYZING {total} ARTICLES WITH GPT-4O-MINI")
     print(f"{'='*80}\n")
-    
+
+    BATCH_SIZE = 50
     analyzed_count = 0
-    
-    for idx, article in enumerate(articles, 1):
-        try:
-            print(f"[{idx}/{len(articles)}] Analyzing: {article.title[:60]}...")
-            
-            article_data = {
-                "title": article.title,
-                "content": article.content or article.title,
-                "url": article.url,
-                "source": article.source
-            }
-            
-            # Run AI analysis
-            analysis = await ai_service.analyze_article(article_data)
-            
-            # Update article
-            article.summary = analysis.get('summary')
-            article.priority_score = analysis.get('priority_score')
-            article.category = analysis.get('category')
-            article.county = analysis.get('county')
-            article.analyzed = True
-            
-            db.commit()
-            
-            print(f"  ✅ Priority: {article.priority_score}/10 | Category: {article.category} | County: {article.county}")
-            analyzed_count += 1
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            db.rollback()
-            continue
-    
+    idx = 0
+    # Articles that error stay analyzed=False, so exclude them from the
+    # re-query — otherwise a persistently failing row would be returned
+    # by every subsequent LIMIT batch and the loop would never finish.
+    failed_ids = set()
+
+    while True:
+        query = db.query(Article).filter(Article.analyzed == False)
+        if failed_ids:
+            query = query.filter(Article.id.notin_(failed_ids))
+        batch = query.limit(BATCH_SIZE).all()
+        if not batch:
+            break
+
+        for article in batch:
+            idx += 1
+            try:
+                print(f"[{idx}/{total}] Analyzing: {article.title[:60]}...")
+
+                article_data = {
+                    "title": article.title,
+                    "content": article.content or article.title,
+                    "url": article.url,
+                    "source": article.source
+                }
+
+                # Run AI analysis
+                analysis = await ai_service.analyze_article(article_data)
+
+                # Update article
+                article.summary = analysis.get('summary')
+                article.priority_score = analysis.get('priority_score')
+                article.category = analysis.get('category')
+                article.county = analysis.get('county')
+                article.analyzed = True
+
+                db.commit()
+
+                print(f"  ✅ Priority: {article.priority_score}/10 | Category: {article.category} | County: {article.county}")
+                analyzed_count += 1
+
+            except Exception as e:
+                print(f"  ❌ Error: {e}")
+                db.rollback()
+                failed_ids.add(article.id)
+                continue
+
     print(f"\n{'='*80}")
-    print(f"✅ ANALYSIS COMPLETE - {analyzed_count}/{len(articles)} articles analyzed")
+    print(f"✅ ANALYSIS COMPLETE - {analyzed_count}/{total} articles analyzed")
     print(f"{'='*80}\n")
     
     db.close()
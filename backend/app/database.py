@@ -5,12 +5,26 @@ from app.config import settings
 
 # Only use check_same_thread for SQLite
 connect_args = {}
+engine_kwargs = {}
 if settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
+else:
+    # Shared by the API and the seed/migration CLIs: batched executemany on
+    # psycopg2 plus pre-ping so pooled connections to the Azure-hosted DB
+    # survive idle disconnects.
+    engine_kwargs = {
+        "executemany_mode": "values_plus_batch",
+        "executemany_batch_page_size": 500,
+        "insertmanyvalues_page_size": 1000,
+        "pool_pre_ping": True,
+        "pool_size": 5,
+        "max_overflow": 5,
+    }
 
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args=connect_args
+    connect_args=connect_args,
+    **engine_kwargs
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -5,18 +5,35 @@ Run from backend/ with venv activated:
     python seed_watchlist.py
 """
 
+import logging
 import sys
 import os
+import time
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from datetime import datetime, timezone
-from app.database import engine, Base, SessionLocal
+
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import func, select, text
+from app.database import SessionLocal
 from app.models import WatchedMatter, MatterHistory
 
+logger = logging.getLogger(__name__)
+
+
+def _upgrade_schema():
+    """Bring the schema to head via Alembic instead of create_all().
+
+    One tracked mechanism for DDL (alembic_version) rather than racing
+    the setup_*_schema scripts; no-ops instantly when already at head.
+    """
+    cfg = AlembicConfig(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+    alembic_command.upgrade(cfg, "head")
+
 
 def seed():
-    # Ensure tables exist from ORM models (idempotent)
-    Base.metadata.create_all(bind=engine)
+    _upgrade_schema()
 
     db = SessionLocal()
 
@@ -113,51 +130,95 @@ def seed():
     ]
 
     try:
+        # Regenerable seed data doesn't need per-statement WAL fsyncs; the
+        # final COMMIT still makes everything durable in one flush.
+        if db.bind.dialect.name == "postgresql":
+            db.execute(text("SET LOCAL synchronous_commit = OFF"))
+            db.execute(text("SET LOCAL commit_delay = 0"))
+
         inserted = 0
         skipped = 0
+        new_matters = []
+        new_histories = []
+
+        # One round-trip for the idempotency check instead of a SELECT per item
+        ids = [d["matter_id"] for d in items]
+        existing_ids = set(db.scalars(
+            select(WatchedMatter.matter_id).where(WatchedMatter.matter_id.in_(ids))
+        ).all())
+
+        t0 = time.perf_counter()
 
         for item_data in items:
-            # Check if already exists
-            existing = db.query(WatchedMatter).filter_by(matter_id=item_data["matter_id"]).first()
-            if existing:
-                print(f"  SKIP (exists): {item_data['matter_file']} - {item_data['title'][:60]}")
+            if item_data["matter_id"] in existing_ids:
                 skipped += 1
                 continue
 
-            matter = WatchedMatter(**item_data)
-            db.add(matter)
-            db.flush()  # Get the ID assigned
-
-            # Add initial history entry
-            history = MatterHistory(
-                matter_id=item_data["matter_id"],
-                action_date=item_data.get("last_action_date") or datetime.now(timezone.utc),
-                action_text="Added to Eagle Harbor Monitor watchlist",
-                action_body=item_data["body_name"],
-                is_milestone=True,
-                notified=False,
-            )
-            db.add(history)
-
-            print(f"  ADDED: {item_data['matter_file']} - {item_data['title'][:60]}")
+            new_matters.append(item_data)
+
+            # Initial history entry — matter_id is supplied explicitly, so no
+            # flush is needed to learn a server-assigned key.
+            new_histories.append({
+                "matter_id": item_data["matter_id"],
+                "action_date": item_data.get("last_action_date") or datetime.now(timezone.utc),
+                "action_text": "Added to Eagle Harbor Monitor watchlist",
+                "action_body": item_data["body_name"],
+                "is_milestone": True,
+                "notified": False,
+            })
+
             inserted += 1
 
-        db.commit()
+        # Two Core executemany inserts for the whole batch — matters first so
+        # the history FK targets exist — instead of a statement per row. Seed
+        # rows are write-only, so ORM instance construction buys nothing.
+        if new_matters:
+            db.execute(WatchedMatter.__table__.insert(), new_matters)
+            db.execute(MatterHistory.__table__.insert(), new_histories)
 
+        db.commit()
+        elapsed = time.perf_counter() - t0
+
+        # Refresh planner statistics so queries right after seeding don't
+        # wait on autovacuum to sample the tables.
+        if db.bind.dialect.name == "postgresql":
+            db.execute(text("ANALYZE watched_matters"))
+            db.execute(text("ANALYZE matter_histories"))
+            db.commit()
+
+        # One summary line after the commit instead of a print per row —
+        # keeps stdout flushes off the timed insert path and makes seed
+        # throughput itself measurable.
+        logger.info("watchlist seed: %d inserted, %d skipped in %.2fs",
+                    inserted, skipped, elapsed)
         print(f"\n{'='*60}")
-        print(f"Watchlist seeding complete!")
+        print(f"Watchlist seeding complete! ({elapsed:.2f}s)")
         print(f"  Inserted: {inserted}")
         print(f"  Skipped:  {skipped}")
         print(f"{'='*60}")
 
-        # Show summary
-        all_items = db.query(WatchedMatter).filter_by(is_active=True).all()
-        print(f"\nActive Watchlist Items ({len(all_items)}):")
+        # Show summary — Core select of just the printed columns with a
+        # LIMIT, so this stays cheap once auto-detected items grow the
+        # watchlist; no ORM instances are hydrated for a print-only view.
+        active_count = db.scalar(
+            select(func.count()).select_from(WatchedMatter)
+            .where(WatchedMatter.is_active == True)
+        )
+        shown = db.execute(
+            select(WatchedMatter.matter_file, WatchedMatter.title,
+                   WatchedMatter.current_status, WatchedMatter.priority)
+            .where(WatchedMatter.is_active == True)
+            .order_by(WatchedMatter.priority.desc())
+            .limit(20)
+        ).all()
+        print(f"\nActive Watchlist Items ({active_count}):")
         print("-" * 70)
-        for m in all_items:
-            icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(m.priority, "⚪")
-            print(f"  {icon} [{m.matter_file}] {m.title[:65]}")
-            print(f"     Status: {m.current_status} | Priority: {m.priority}")
+        for matter_file, title, current_status, priority in shown:
+            icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(priority, "⚪")
+            print(f"  {icon} [{matter_file}] {title[:65]}")
+            print(f"     Status: {current_status} | Priority: {priority}")
+        if active_count > len(shown):
+            print(f"  (+{active_count - len(shown)} more)")
 
     except Exception as e:
         db.rollback()
@@ -1,5 +1,8 @@
 """Apply Amendment Watchlist schema migration.
 
+NOTE: new deployments should use `alembic upgrade head` instead — this
+script is kept for environments already provisioned by it.
+
 Run from the backend/ directory with venv activated:
     python setup_watchlist_schema.py
 
@@ -15,7 +18,6 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from app.database import engine
 from app.config import settings
-from sqlalchemy import text
 
 
 # PostgreSQL syntax (production)
@@ -41,7 +43,7 @@ CREATE TABLE IF NOT EXISTS watched_matters (
     compatibility_standards TEXT,
     created_date TIMESTAMP DEFAULT NOW(),
     updated_date TIMESTAMP DEFAULT NOW()
-);
+) WITH (fillfactor = 90);
 
 CREATE TABLE IF NOT EXISTS matter_histories (
     id SERIAL PRIMARY KEY,
@@ -173,6 +175,22 @@ CREATE INDEX IF NOT EXISTS idx_matter_votes_matter_id ON matter_votes(matter_id)
 CREATE INDEX IF NOT EXISTS idx_matter_votes_date ON matter_votes(vote_date DESC);
 """
 
+# PostgreSQL index variants. CONCURRENTLY avoids the ACCESS EXCLUSIVE lock
+# when re-running against a populated DB, but must run outside a transaction
+# and one statement at a time. The covering index serves the "list active
+# watched matters" summary query with an index-only scan.
+PG_INDEX_STATEMENTS = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_watched_matters_matter_id ON watched_matters(matter_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_watched_matters_active ON watched_matters(is_active)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_watched_matters_active_list"
+    " ON watched_matters(is_active) INCLUDE (matter_file, title, current_status, priority)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_matter_histories_matter_id ON matter_histories(matter_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_matter_histories_action_date ON matter_histories(action_date DESC)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_matter_attachments_matter_id ON matter_attachments(matter_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_matter_votes_matter_id ON matter_votes(matter_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_matter_votes_date ON matter_votes(vote_date DESC)",
+]
+
 
 def is_sqlite():
     db_url = str(settings.DATABASE_URL)
@@ -184,28 +202,33 @@ def main():
     db_type = "SQLite" if using_sqlite else "PostgreSQL"
     print(f"Applying Amendment Watchlist schema migration ({db_type})...")
 
-    migration_sql = SQLITE_MIGRATION_SQL if using_sqlite else PG_MIGRATION_SQL
-
-    with engine.connect() as conn:
-        # Execute table creation
-        for statement in migration_sql.strip().split(";"):
-            stmt = statement.strip()
-            if stmt and not stmt.startswith("--"):
-                try:
-                    conn.execute(text(stmt))
-                except Exception as e:
-                    print(f"  Warning: {e}")
-
-        # Execute index creation
-        for statement in INDEX_SQL.strip().split(";"):
-            stmt = statement.strip()
-            if stmt and not stmt.startswith("--"):
-                try:
-                    conn.execute(text(stmt))
-                except Exception as e:
-                    print(f"  Index warning: {e}")
-
-        conn.commit()
+    # Run the DDL as whole batches on the raw driver connection — one
+    # round-trip for tables and one for indexes, in a single transaction,
+    # with no fragile split(";") parsing of the SQL.
+    # A failed migration must fail loudly — swallowing the exception here
+    # used to leave the schema half-applied with only a "Warning" line.
+    raw = engine.raw_connection()
+    try:
+        if using_sqlite:
+            # sqlite3's native multi-statement batch path
+            raw.executescript(SQLITE_MIGRATION_SQL + INDEX_SQL)
+            raw.commit()
+        else:
+            dbapi = raw.driver_connection
+            cur = dbapi.cursor()
+            cur.execute(PG_MIGRATION_SQL)
+            dbapi.commit()
+            # CONCURRENTLY refuses to run inside a transaction block
+            dbapi.autocommit = True
+            for stmt in PG_INDEX_STATEMENTS:
+                cur.execute(stmt)
+            dbapi.autocommit = False
+            cur.close()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
 
     print("✅ Watchlist schema migration complete!")
     print("   Tables: watched_matters, matter_histories, matter_attachments, matter_votes")
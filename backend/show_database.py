@@ -1,29 +1,53 @@
+import sys
+
+from sqlalchemy import func, select
+
 from app.database import SessionLocal
 from app.models import Article
 
 db = SessionLocal()
-articles = db.query(Article).order_by(Article.discovered_date.desc()).all()
-
-print(f"\n{'='*80}")
-print(f"EAGLE HARBOR MONITOR DATABASE STATUS")
-print(f"{'='*80}")
-print(f"\n📊 Total Articles: {len(articles)}")
-
-analyzed = [a for a in articles if a.analyzed]
-print(f"✅ Analyzed: {len(analyzed)}")
-print(f"⏳ Pending Analysis: {len(articles) - len(analyzed)}")
-
-print(f"\n📰 Latest Articles:")
-print(f"{'='*80}\n")
-
-for idx, article in enumerate(articles[:10], 1):
-    status = "✅" if article.analyzed else "⏳"
-    priority = f"{article.priority_score or 0}/10" if article.priority_score else "N/A"
-    category = article.category or "pending"
-    county = article.county or "?"
-    
-    print(f"{idx}. {status} [{priority}] {article.title[:65]}...")
-    print(f"   Category: {category} | County: {county} | Source: {article.source}")
-    print()
+
+# Counts via aggregate queries and only the displayed columns for the top 10
+# — the old query pulled every article's full content/summary into ORM
+# objects just to count them and print six fields.
+counts = dict(
+    db.execute(
+        select(Article.analyzed, func.count()).group_by(Article.analyzed)
+    ).all()
+)
+total = sum(counts.values())
+analyzed_count = counts.get(True, 0)
+
+rows = db.execute(
+    select(Article.title, Article.category, Article.county, Article.source,
+           Article.priority_score, Article.analyzed)
+    .order_by(Article.discovered_date.desc())
+    .limit(10)
+).all()
+
+# Accumulate the report and write it once — one syscall instead of a
+# flush per print(), which matters when stdout is a streamed log.
+out = [
+    f"\n{'='*80}",
+    "EAGLE HARBOR MONITOR DATABASE STATUS",
+    f"{'='*80}",
+    f"\n📊 Total Articles: {total}",
+    f"✅ Analyzed: {analyzed_count}",
+    f"⏳ Pending Analysis: {total - analyzed_count}",
+    "\n📰 Latest Articles:",
+    f"{'='*80}\n",
+]
+
+for idx, (title, category, county, source, priority_score, analyzed) in enumerate(rows, 1):
+    status = "✅" if analyzed else "⏳"
+    priority = f"{priority_score or 0}/10" if priority_score else "N/A"
+    category = category or "pending"
+    county = county or "?"
+
+    out.append(f"{idx}. {status} [{priority}] {title[:65]}...")
+    out.append(f"   Category: {category} | County: {county} | Source: {source}")
+    out.append("")
+
+sys.stdout.write("\n".join(out) + "\n")
 
 db.close()
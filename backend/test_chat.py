@@ -3,8 +3,10 @@
 import asyncio
 import re
 import logging
+import sys
 from datetime import datetime, timedelta
-from sqlalchemy import or_, desc
+from sqlalchemy import case, func, or_, desc, text
+from sqlalchemy.orm import load_only
 from app.database import SessionLocal
 from app.models import Article, Event
 from app.services.ai_service import AIService
@@ -12,6 +14,30 @@ from app.services.ai_service import AIService
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Hoisted to module scope so repeat calls (and the routes.py hot path this
+# mirrors) don't re-build the regexes or stopword set per question.
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+_PHRASE_MAP = {
+    "data center": "data center", "task force": "task force",
+    "planning board": "planning board", "eagle harbor": "eagle harbor",
+    "chalk point": "chalk point", "zoning amendment": "zoning amendment",
+}
+# One scan over the question instead of a substring test per phrase
+_PHRASE_RE = re.compile("|".join(map(re.escape, _PHRASE_MAP)))
+
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "if", "then", "to", "of", "in", "on", "for", "with",
+    "is", "are", "was", "were", "be", "been", "being", "it", "this", "that", "these", "those",
+    "what", "when", "where", "why", "how", "about", "from", "by", "as", "at", "into", "over",
+    "do", "does", "did", "can", "could", "should", "would", "will", "may", "might",
+    "data", "center", "centers", "county", "maryland", "prince", "george", "charles",
+})
+
+# Module-level singleton, matching how the API keeps one AIService per
+# process — repeat questions reuse its HTTP client's keep-alive pool.
+ai_service = AIService()
+
 async def test_ask():
     question = "What is the latest on the Data Center Task Force in Prince George's County?"
     print(f"\n{'='*80}")
@@ -19,79 +45,95 @@ async def test_ask():
     print(f"{'='*80}\n")
 
     db = SessionLocal()
-    ai_service = AIService()
     print(f"AI service enabled: {ai_service.enabled}")
 
     question_lower = question.lower()
 
-    # Domain phrase detection (same logic as routes.py)
-    domain_phrases = []
-    phrase_map = {
-        "data center": "data center", "task force": "task force",
-        "planning board": "planning board", "eagle harbor": "eagle harbor",
-        "chalk point": "chalk point", "zoning amendment": "zoning amendment",
-    }
-    for phrase in phrase_map:
-        if phrase in question_lower:
-            domain_phrases.append(phrase_map[phrase])
-
-    stopwords = {
-        "the", "a", "an", "and", "or", "but", "if", "then", "to", "of", "in", "on", "for", "with",
-        "is", "are", "was", "were", "be", "been", "being", "it", "this", "that", "these", "those",
-        "what", "when", "where", "why", "how", "about", "from", "by", "as", "at", "into", "over",
-        "do", "does", "did", "can", "could", "should", "would", "will", "may", "might",
-        "data", "center", "centers", "county", "maryland", "prince", "george", "charles",
-    }
-    tokens = [t for t in re.findall(r"[a-z0-9']+", question_lower) if t not in stopwords and len(t) > 2]
+    # Domain phrase detection (same logic as routes.py); dict.fromkeys keeps
+    # first-seen order while deduping overlapping matches
+    domain_phrases = [
+        _PHRASE_MAP[m] for m in dict.fromkeys(_PHRASE_RE.findall(question_lower))
+    ]
+
+    tokens = [t for t in _TOKEN_RE.findall(question_lower) if len(t) > 2 and t not in _STOPWORDS]
 
     print(f"Domain phrases: {domain_phrases}")
     print(f"Search tokens: {tokens}")
 
     cutoff = datetime.now() - timedelta(days=180)
 
-    # Keyword search
-    conditions = []
-    for phrase in domain_phrases:
-        like = f"%{phrase}%"
-        conditions.extend([Article.title.ilike(like), Article.summary.ilike(like), Article.content.ilike(like)])
-    for token in tokens:
-        like = f"%{token}%"
-        conditions.extend([Article.title.ilike(like), Article.summary.ilike(like), Article.content.ilike(like)])
-
-    keyword_articles = db.query(Article).filter(
+    # Keyword search. On Postgres this is one tsquery match against the GIN
+    # index from the articles_fts migration — index probes instead of a
+    # sequential scan running 3×(phrases+tokens) ILIKE tests per row. The
+    # expression must stay byte-identical to the indexed one. SQLite (local
+    # dev) keeps the ILIKE fallback.
+    # load_only defers the multi-KB content column — only the 500-char
+    # excerpts actually sent to the AI get fetched, in one batch below
+    base_query = db.query(Article).options(
+        load_only(Article.id, Article.title, Article.url, Article.summary,
+                  Article.priority_score, Article.category)
+    ).filter(
         Article.analyzed == True,
         Article.discovered_date >= cutoff,
-        or_(*conditions)
-    ).order_by(desc(Article.priority_score), desc(Article.discovered_date)).limit(10).all()
-
-    print(f"\nKeyword matches: {len(keyword_articles)}")
-    for a in keyword_articles:
-        print(f"  [{a.priority_score}/10] {a.title[:80]}")
-
-    # Backfill with high-priority articles
-    seen_ids = {a.id for a in keyword_articles}
-    articles = list(keyword_articles)
-    if len(articles) < 10:
-        recent_top = db.query(Article).filter(
-            Article.analyzed == True, Article.discovered_date >= cutoff
-        ).order_by(desc(Article.priority_score), desc(Article.discovered_date)).limit(15).all()
-        for a in recent_top:
-            if a.id not in seen_ids:
-                articles.append(a)
-                seen_ids.add(a.id)
-            if len(articles) >= 10:
-                break
-
-    print(f"\nTotal articles for context: {len(articles)}")
+    )
+    # One query for both the keyword matches and the high-priority backfill:
+    # a CASE match flag sorts matching rows first, then priority/recency
+    # fills the remainder — no second round-trip or Python-side dedup.
+    params = {}
+    if db.bind.dialect.name == "postgresql":
+        fts = (
+            "to_tsvector('english', coalesce(title,'') || ' ' || "
+            "coalesce(summary,'') || ' ' || coalesce(content,''))"
+        )
+        search_terms = " OR ".join([f'"{p}"' for p in domain_phrases] + tokens)
+        match_clause = text(f"{fts} @@ websearch_to_tsquery('english', :q)")
+        rank_order = [text(
+            f"ts_rank_cd({fts}, websearch_to_tsquery('english', :q)) DESC"
+        )]
+        params = {"q": search_terms}
+    else:
+        # One predicate per term over a single concatenated haystack rather
+        # than three ILIKEs per term — the planner sees K LIKE nodes
+        # instead of 3K. (Postgres's ILIKE ANY(ARRAY[...]) form doesn't
+        # apply here; that path uses FTS above.)
+        haystack = func.lower(
+            func.coalesce(Article.title, "") + " "
+            + func.coalesce(Article.summary, "") + " "
+            + func.coalesce(Article.content, "")
+        )
+        match_clause = or_(*[
+            haystack.like(f"%{term.lower()}%") for term in [*domain_phrases, *tokens]
+        ])
+        rank_order = []
+
+    # The 500-char excerpt is sliced server-side with substr, so the
+    # multi-KB content column never crosses the wire — this projection
+    # replaces the old full-column fetch plus Python-side [:500].
+    match_expr = case((match_clause, 1), else_=0).label("match_score")
+    excerpt_expr = func.substr(Article.content, 1, 500).label("content_excerpt")
+    results = base_query.add_columns(match_expr, excerpt_expr).order_by(
+        desc("match_score"), *rank_order,
+        desc(Article.priority_score), desc(Article.discovered_date)
+    ).params(**params).limit(10).all()
+
+    articles = [a for a, _, _ in results]
+    keyword_articles = [a for a, matched, _ in results if matched]
+
+    # Buffer the listing and write once — one syscall instead of a flush
+    # per print()
+    out = [f"\nKeyword matches: {len(keyword_articles)}"]
+    out.extend(f"  [{a.priority_score}/10] {a.title[:80]}" for a in keyword_articles)
+    out.append(f"\nTotal articles for context: {len(articles)}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Build context for AI (matches routes.py logic)
     article_context = []
-    for a in articles:
+    for a, _, excerpt in results:
         ctx = {"title": a.title, "url": a.url, "priority_score": a.priority_score}
         if a.summary:
             ctx["summary"] = a.summary
-        if a.content:
-            ctx["content"] = a.content[:500]
+        if excerpt:
+            ctx["content"] = excerpt
         if a.category:
             ctx["category"] = a.category
         article_context.append(ctx)
@@ -105,11 +147,12 @@ async def test_ask():
     print(answer)
     print(f"{'='*80}")
 
-    # Show source articles used
-    print(f"\nSOURCES ({len(articles)} articles provided as context):")
+    # Show source articles used (buffered, single write)
+    out = [f"\nSOURCES ({len(articles)} articles provided as context):"]
     for a in articles[:5]:
-        print(f"  - [{a.priority_score}/10] {a.title[:70]}")
-        print(f"    {a.url}")
+        out.append(f"  - [{a.priority_score}/10] {a.title[:70]}")
+        out.append(f"    {a.url}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     db.close()
 
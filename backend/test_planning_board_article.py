@@ -10,9 +10,11 @@ from app.config import settings
 # Ensure database exists
 Base.metadata.create_all(bind=engine)
 
+# Shared across calls so repeat runs reuse one HTTP client
+ai_service = AIService()
+
 async def test_planning_board_article():
     db = SessionLocal()
-    ai_service = AIService()
     
     article_content = """Greetings District 9 residents and beyond,
 
@@ -1,21 +1,103 @@
 import azure.functions as func
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 import os
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine, text
+from sqlalchemy import (Boolean, Column, DateTime, Integer, MetaData, String,
+                        Table, Text, bindparam, create_engine, text)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker
 import json
 
+# orjson's C encoder/decoder is several times faster than the stdlib and
+# emits bytes, which HttpResponse takes as-is
+try:
+    import orjson
+except ImportError:  # local runs without the wheel fall back to stdlib
+    orjson = None
+
 app = func.FunctionApp()
 
-# Database setup
+# Prefer the C-backed lxml parser (5-10x faster on article-sized HTML);
+# fall back to the bundled pure-Python parser so a worker missing the
+# wheel still scrapes, just slower.
+try:
+    BeautifulSoup("", "lxml")
+    _SOUP_PARSER = "lxml"
+except FeatureNotFound:
+    _SOUP_PARSER = "html.parser"
+
+# Build the article tree from content-bearing tags only — head-level
+# script/style/meta and top-level chrome are never parsed into nodes.
+# (Scripts nested inside kept divs still are, so the decompose pass in
+# scrape_article_content stays.)
+_CONTENT_STRAINER = SoupStrainer(['article', 'main', 'div', 'p', 'h1', 'h2', 'h3'])
+
+# Matched natively by bs4 against each class token — no Python callback
+# per element like the old class_=lambda filter
+_POST_CLASS_RE = re.compile(r'post|entry|news-item')
+
+_WS_RE = re.compile(r'\s+')
+
+# One pooled HTTP session per worker — TCP and TLS connections to repeat
+# hosts (Legistar, the planning board site, article pages) are kept alive
+# and reused instead of re-handshaking on every request.
+HTTP = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+HTTP.mount('https://', _adapter)
+HTTP.mount('http://', _adapter)
+
+# Database setup. The pool is sized for concurrent function invocations
+# (several timers can overlap) so executions don't serialize on pool
+# checkout; pre-ping and recycle guard against Azure PG idle disconnects.
 DATABASE_URL = os.environ["DATABASE_URL"]
-engine = create_engine(DATABASE_URL)
+engine = create_engine(
+    DATABASE_URL,
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,
+    insertmanyvalues_page_size=1000,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 SessionLocal = sessionmaker(bind=engine)
 
+# Minimal Core table for the scrapers' set-based article upserts. The url
+# unique index (uq_articles_url / the model's unique=True) is the ON CONFLICT
+# target, making inserts atomic and race-free across overlapping runs.
+_metadata = MetaData()
+articles_table = Table(
+    "articles", _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("title", String(500)),
+    Column("url", String(1000)),
+    Column("summary", Text),
+    Column("content", Text),
+    Column("source", String(200)),
+    Column("published_date", DateTime),
+    Column("discovered_date", DateTime),
+    Column("analyzed", Boolean),
+)
+
+# Per-feed ETag/Last-Modified state for conditional RSS GETs (see the
+# feed_state migration) — unchanged feeds answer 304 with no body to parse.
+feed_state_table = Table(
+    "feed_state", _metadata,
+    Column("feed_url", String(1000), primary_key=True),
+    Column("etag", String(500)),
+    Column("last_modified", String(100)),
+)
+
 # ── Keyword tiers for geographic filtering ────────────────────────────────────
 # Keep in sync with backend/app/config.py settings.KEYWORDS
 
@@ -94,6 +176,112 @@ REGIONAL_FEEDS = {
 }
 
 
+def _compile_keywords(words):
+    """Compile a keyword list into one case-insensitive alternation regex.
+
+    A single C-level scan replaces the per-keyword `kw in text` loop that
+    lowercases and walks the text once per keyword. Unanchored on purpose:
+    the original substring checks also matched plural/possessive phrasings
+    ("data centers", "substations", "prince georges"), and those must keep
+    passing the filter.
+    """
+    return re.compile(r"(?i)" + "|".join(re.escape(w) for w in words))
+
+
+_MD_SPECIFIC_RE = _compile_keywords(MARYLAND_SPECIFIC_KEYWORDS)
+_GEOGRAPHIC_RE = _compile_keywords(GEOGRAPHIC_KEYWORDS)
+_CONTEXTUAL_RE = _compile_keywords(CONTEXTUAL_KEYWORDS)
+_SCRAPER_KW_RE = _compile_keywords(SCRAPER_KEYWORDS)
+_WATCHLIST_RE = _compile_keywords(WATCHLIST_AUTO_DETECT_KEYWORDS)
+
+# Small per-item heuristics, compiled for the same reason: one C-level
+# scan per body name / anchor instead of a Python any() loop
+_ITEM_CHECK_RE = re.compile(r'council|planning|zoning|environment|economic')
+_AGENDA_LINK_RE = re.compile(r'agenda|minutes|meeting')
+
+
+# ── Hoisted SQL statements — parsed/cache-keyed once at module load instead
+# of inside each handler's hot loop ────────────────────────────────────────────
+_UPDATE_CONTENT_BY_URL = text("UPDATE articles SET content = :content WHERE url = :url")
+
+_INSERT_WATCHED_MATTER = text("""
+    INSERT INTO watched_matters
+        (matter_id, matter_file, matter_type, title, body_name,
+         current_status, legistar_url, watch_reason, auto_detected, is_active, priority)
+    VALUES (:mid, :mfile, :mtype, :title, :body,
+            :status, :url, :reason, TRUE, TRUE, 'high')
+""")
+
+# SKIP LOCKED lets overlapping analyzer runs claim disjoint batches
+# instead of re-selecting (and re-analyzing) the same rows
+_SELECT_UNANALYZED = text("""
+    SELECT id, title, summary, content, source
+    FROM articles
+    WHERE analyzed = FALSE
+    ORDER BY id
+    LIMIT :n
+    FOR UPDATE SKIP LOCKED
+""")
+
+_UPDATE_ANALYSIS = text("""
+    UPDATE articles
+    SET relevance_score = :relevance,
+        priority_score = :priority,
+        category = :category,
+        county = :county,
+        summary = CASE WHEN :summary != '' THEN :summary ELSE summary END,
+        analyzed = TRUE
+    WHERE id = :id
+""")
+
+_MARK_ANALYZED = text("""
+    UPDATE articles
+    SET analyzed = TRUE, relevance_score = 0
+    WHERE id = :id
+""")
+
+_Q_ARTICLES_BY_URLS = text(
+    "SELECT url FROM articles WHERE url IN :urls"
+).bindparams(bindparam("urls", expanding=True))
+
+_Q_HISTORY_EXISTS = text(
+    "SELECT 1 FROM matter_histories WHERE legistar_history_id = :hid")
+_Q_ATTACHMENT_EXISTS = text(
+    "SELECT 1 FROM matter_attachments WHERE legistar_attachment_id = :aid")
+_Q_VOTE_EXISTS = text(
+    "SELECT 1 FROM matter_votes WHERE legistar_vote_id = :vid")
+
+_INSERT_MATTER_HISTORY = text("""
+    INSERT INTO matter_histories
+        (matter_id, legistar_history_id, action_date, action_text,
+         action_body, result, vote_info, minutes_note,
+         previous_status, new_status, is_milestone, notified, discovered_date)
+    VALUES (:mid, :hid, :adate, :atext,
+            :abody, :result, :vinfo, :mnote,
+            :pstatus, :nstatus, :milestone, FALSE, :now)
+""")
+
+_INSERT_MATTER_ATTACHMENT = text("""
+    INSERT INTO matter_attachments
+        (matter_id, legistar_attachment_id, name, hyperlink,
+         file_type, content_text, analyzed, notified, discovered_date)
+    VALUES (:mid, :aid, :name, :link,
+            :ftype, :content, FALSE, FALSE, :now)
+""")
+
+_INSERT_MATTER_VOTE = text("""
+    INSERT INTO matter_votes
+        (matter_id, legistar_vote_id, vote_date, body_name,
+         result, tally, roll_call, notified, discovered_date)
+    VALUES (:mid, :vid, :vdate, :body,
+            :result, :tally, :roll_call, FALSE, :now)
+""")
+
+_MARK_ARTICLE_NOTIFIED = text("UPDATE articles SET notified = TRUE WHERE id = :id")
+_MARK_HISTORY_NOTIFIED = text("UPDATE matter_histories SET notified = TRUE WHERE id = :id")
+_MARK_ATTACHMENT_NOTIFIED = text("UPDATE matter_attachments SET notified = TRUE WHERE id = :id")
+
+
 def passes_keyword_filter(title: str, summary: str, feed_url: str) -> bool:
     """Check if an article passes the keyword filter for its feed tier.
 
@@ -103,18 +291,18 @@ def passes_keyword_filter(title: str, summary: str, feed_url: str) -> bool:
       a GEOGRAPHIC_KEYWORDS match.
     - Regional feeds (WTOP, WaPo): same AND logic as global feeds.
     """
-    content_text = f"{title} {summary}".lower()
+    content_text = f"{title} {summary}"
 
     if feed_url in GLOBAL_FEEDS or feed_url in REGIONAL_FEEDS:
-        # Must match at least one contextual keyword AND one geographic keyword
-        has_contextual = any(kw.lower() in content_text for kw in CONTEXTUAL_KEYWORDS)
-        has_geographic = any(kw.lower() in content_text for kw in GEOGRAPHIC_KEYWORDS)
-        # Also pass if any Maryland-specific keyword appears (they're inherently geo-scoped)
-        has_md_specific = any(kw.lower() in content_text for kw in MARYLAND_SPECIFIC_KEYWORDS)
-        return (has_contextual and has_geographic) or has_md_specific
+        # Must match at least one contextual keyword AND one geographic keyword.
+        # Also pass if any Maryland-specific keyword appears (they're inherently
+        # geo-scoped). Short-circuit the cheap single-scan checks in order.
+        if _MD_SPECIFIC_RE.search(content_text):
+            return True
+        return bool(_CONTEXTUAL_RE.search(content_text)) and bool(_GEOGRAPHIC_RE.search(content_text))
     else:
         # Local/Maryland feeds — any keyword match is enough
-        return any(kw.lower() in content_text for kw in SCRAPER_KEYWORDS)
+        return _SCRAPER_KW_RE.search(content_text) is not None
 
 
 def scrape_article_content(url: str, timeout: int = 15) -> str:
@@ -126,20 +314,30 @@ def scrape_article_content(url: str, timeout: int = 15) -> str:
         headers = {
             'User-Agent': 'Mozilla/5.0 (compatible; EagleHarborMonitor/1.0; +https://eagleharbormonitor.org)'
         }
-        resp = requests.get(url, timeout=timeout, headers=headers)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        # Stream the body and stop at 1 MiB — article text lives well
+        # within that, and modern pages ship multiple MB of bundled JS we
+        # would only download to throw away (we keep 5000 chars of text).
+        with HTTP.get(url, timeout=timeout, headers=headers, stream=True) as resp:
+            resp.raise_for_status()
+            buf = bytearray()
+            for chunk in resp.iter_content(chunk_size=65536):
+                buf.extend(chunk)
+                if len(buf) >= 1_000_000:
+                    break
+        # lxml's C parser is several times faster than the pure-Python
+        # html.parser backend on Legistar/news pages; feeding it raw bytes
+        # also skips the full-buffer resp.text decode. The strainer keeps
+        # DOM construction to the content-bearing subtrees.
+        soup = BeautifulSoup(bytes(buf), _SOUP_PARSER, parse_only=_CONTENT_STRAINER)
 
         # Remove script/style/nav elements
         for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
             tag.decompose()
 
-        # Try common article body selectors
-        article_body = (
-            soup.find('article') or
-            soup.find('div', class_=lambda c: c and any(x in (c if isinstance(c, str) else ' '.join(c)) for x in ['article-body', 'story-body', 'entry-content', 'post-content'])) or
-            soup.find('div', {'role': 'article'}) or
-            soup.find('main')
+        # Try common article body selectors (one CSS pass)
+        article_body = soup.select_one(
+            'article, div.article-body, div.story-body, div.entry-content, '
+            'div.post-content, div[role=article], main'
         )
 
         if article_body:
@@ -149,8 +347,9 @@ def scrape_article_content(url: str, timeout: int = 15) -> str:
             paragraphs = soup.find_all('p')
             text = ' '.join(p.get_text(strip=True) for p in paragraphs)
 
-        # Clean up whitespace
-        text = ' '.join(text.split())
+        # Clean up whitespace in one C-level pass — no token list like
+        # ' '.join(text.split()) builds
+        text = _WS_RE.sub(' ', text).strip()
         return text[:5000]
     except Exception as e:
         logging.warning(f"Could not scrape content from {url}: {e}")
@@ -178,16 +377,24 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
     events_cutoff = (datetime.now() - timedelta(days=14)).strftime("%Y-%m-%d")
     matters_cutoff = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%dT00:00:00")
 
-    # Only drill into agenda items for bodies that handle zoning / legislation
-    ITEM_CHECK_TERMS = ['council', 'planning', 'zoning', 'environment', 'economic']
-
     try:
         db = SessionLocal()
+        # One timestamp per run — rows from the same scan share a
+        # discovered_date and the syscall stays out of the per-row path
+        scan_time = datetime.now()
         new_articles = 0
 
+        # Candidate rows are collected first, deduplicated against the DB
+        # with one batched URL query, then inserted with one executemany —
+        # no per-row SELECT/INSERT round-trips. needs_detail defers the
+        # detail-page scrape until we know the row is actually new.
+        candidates = []
+        candidate_urls = set()
+        watch_candidates = {}
+
         # ── 1. Recent events (meetings) ──────────────────────────────
         try:
-            resp = requests.get(
+            resp = HTTP.get(
                 f"{LEGISTAR_BASE}/events",
                 params={
                     "$top": 100,
@@ -212,19 +419,20 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
                 event_url = event.get("EventInSiteURL", "")
                 agenda_file = event.get("EventAgendaFile")
 
-                event_text = f"{body_name} {comment}".lower()
-                event_kw_hit = any(kw.lower() in event_text for kw in SCRAPER_KEYWORDS)
+                event_text = f"{body_name} {comment}"
+                event_kw_hit = _SCRAPER_KW_RE.search(event_text) is not None
 
                 # ── 2. Agenda items for relevant bodies ──────────────
-                body_lower = body_name.lower()
+                # Only drill into agenda items for bodies that handle
+                # zoning / legislation
                 should_check_items = (
                     event_kw_hit
-                    or any(t in body_lower for t in ITEM_CHECK_TERMS)
+                    or _ITEM_CHECK_RE.search(body_name.lower()) is not None
                 )
 
                 if should_check_items:
                     try:
-                        ir = requests.get(
+                        ir = HTTP.get(
                             f"{LEGISTAR_BASE}/events/{event_id}/eventitems",
                             headers=API_HEADERS,
                             timeout=15,
@@ -237,8 +445,8 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
                     for item in event_items:
                         item_title = item.get("EventItemTitle", "")
                         item_matter = item.get("EventItemMatterName", "")
-                        item_text = f"{item_title} {item_matter}".lower()
-                        if not any(kw.lower() in item_text for kw in SCRAPER_KEYWORDS):
+                        item_text = f"{item_title} {item_matter}"
+                        if not _SCRAPER_KW_RE.search(item_text):
                             continue
 
                         matter_id = item.get("EventItemMatterId")
@@ -248,7 +456,7 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
                             else event_url or f"{LEGISTAR_BASE}/events/{event_id}"
                         )
 
-                        if db.execute(text("SELECT 1 FROM articles WHERE url = :url"), {"url": item_url}).first():
+                        if item_url in candidate_urls:
                             continue
 
                         title = f"[{body_name} - {event_date}] {item_title or item_matter}"
@@ -256,41 +464,27 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
                             f"Meeting: {body_name}\nDate: {event_date}\n"
                             f"Agenda Item: {item_title}\nMatter: {item_matter}"
                         )
-                        if matter_id:
-                            detail = scrape_article_content(item_url)
-                            if detail:
-                                content = f"{content}\n\n{detail}"
-
-                        db.execute(
-                            text("""
-                            INSERT INTO articles (title, url, content, source, discovered_date, analyzed)
-                            VALUES (:title, :url, :content, :source, :discovered, FALSE)
-                            """),
-                            {"title": title[:500], "url": item_url, "content": content,
-                             "source": "PG County Legistar", "discovered": datetime.now()},
-                        )
-                        new_articles += 1
-                        logging.info(f"New agenda item: {title[:80]}")
+                        candidates.append({
+                            "title": title[:500], "url": item_url, "content": content,
+                            "needs_detail": bool(matter_id),
+                            "log": f"New agenda item: {title[:80]}",
+                        })
+                        candidate_urls.add(item_url)
 
                 # Store the meeting itself when it matches keywords
-                if event_kw_hit and event_url:
-                    if not db.execute(text("SELECT 1 FROM articles WHERE url = :url"), {"url": event_url}).first():
-                        title = f"[Meeting] {body_name} - {event_date}"
-                        if comment:
-                            title = f"{title}: {comment[:200]}"
-                        content = f"Meeting: {body_name}\nDate: {event_date}\nComment: {comment}"
-                        if agenda_file:
-                            content += f"\nAgenda: {agenda_file}"
-
-                        db.execute(
-                            text("""
-                            INSERT INTO articles (title, url, content, source, discovered_date, analyzed)
-                            VALUES (:title, :url, :content, :source, :discovered, FALSE)
-                            """),
-                            {"title": title[:500], "url": event_url, "content": content,
-                             "source": "PG County Legistar", "discovered": datetime.now()},
-                        )
-                        new_articles += 1
+                if event_kw_hit and event_url and event_url not in candidate_urls:
+                    title = f"[Meeting] {body_name} - {event_date}"
+                    if comment:
+                        title = f"{title}: {comment[:200]}"
+                    content = f"Meeting: {body_name}\nDate: {event_date}\nComment: {comment}"
+                    if agenda_file:
+                        content += f"\nAgenda: {agenda_file}"
+
+                    candidates.append({
+                        "title": title[:500], "url": event_url, "content": content,
+                        "needs_detail": False, "log": None,
+                    })
+                    candidate_urls.add(event_url)
 
             except Exception as e:
                 logging.error(f"Event {event.get('EventId')} error: {e}")
@@ -298,7 +492,7 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
 
         # ── 3. Recent legislation (matters) ──────────────────────────
         try:
-            resp = requests.get(
+            resp = HTTP.get(
                 f"{LEGISTAR_BASE}/matters",
                 params={
                     "$top": 100,
@@ -324,12 +518,12 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
                 m_id = matter.get("MatterId")
                 m_file = matter.get("MatterFile", "")
 
-                search_text = f"{m_title} {m_name} {m_file}".lower()
-                if not any(kw.lower() in search_text for kw in SCRAPER_KEYWORDS):
+                search_text = f"{m_title} {m_name} {m_file}"
+                if not _SCRAPER_KW_RE.search(search_text):
                     continue
 
                 matter_url = f"https://princegeorgescountymd.legistar.com/LegislationDetail.aspx?ID={m_id}"
-                if db.execute(text("SELECT 1 FROM articles WHERE url = :url"), {"url": matter_url}).first():
+                if matter_url in candidate_urls:
                     continue
 
                 title = f"[{m_type}] {m_file}: {m_name or m_title[:200]}"
@@ -337,59 +531,103 @@ def legistar_scraper(timer: func.TimerRequest) -> None:
                     f"Type: {m_type}\nFile: {m_file}\nBody: {m_body}\n"
                     f"Status: {m_status}\nTitle: {m_title}"
                 )
-                detail = scrape_article_content(matter_url)
-                if detail:
-                    content = f"{content}\n\n{detail}"
-
-                db.execute(
-                    text("""
-                    INSERT INTO articles (title, url, content, source, discovered_date, analyzed)
-                    VALUES (:title, :url, :content, :source, :discovered, FALSE)
-                    """),
-                    {"title": title[:500], "url": matter_url, "content": content,
-                     "source": "PG County Legistar", "discovered": datetime.now()},
-                )
-                new_articles += 1
-                logging.info(f"New legislation: {title[:80]}")
+                candidates.append({
+                    "title": title[:500], "url": matter_url, "content": content,
+                    "needs_detail": True,
+                    "log": f"New legislation: {title[:80]}",
+                })
+                candidate_urls.add(matter_url)
 
                 # ── Auto-detect watchlist candidates ─────────────────
-                watch_text = f"{m_title} {m_name} {m_file} {m_type}".lower()
-                if any(kw in watch_text for kw in WATCHLIST_AUTO_DETECT_KEYWORDS):
-                    existing_watch = db.execute(
-                        text("SELECT 1 FROM watched_matters WHERE matter_id = :mid"),
-                        {"mid": m_id}
-                    ).first()
-                    if not existing_watch:
-                        try:
-                            db.execute(
-                                text("""
-                                INSERT INTO watched_matters
-                                    (matter_id, matter_file, matter_type, title, body_name,
-                                     current_status, legistar_url, watch_reason, auto_detected, is_active, priority)
-                                VALUES (:mid, :mfile, :mtype, :title, :body,
-                                        :status, :url, :reason, TRUE, TRUE, 'high')
-                                """),
-                                {
-                                    "mid": m_id, "mfile": m_file, "mtype": m_type,
-                                    "title": (m_name or m_title)[:500], "body": m_body,
-                                    "status": m_status, "url": matter_url,
-                                    "reason": f"Auto-detected: matched watchlist keywords in '{m_type}: {m_file}'"
-                                },
-                            )
-                            logging.info(f"Auto-watched matter {m_id}: {m_file} - {m_name or m_title[:60]}")
-                        except Exception as ew:
-                            logging.warning(f"Could not auto-watch matter {m_id}: {ew}")
+                watch_text = f"{m_title} {m_name} {m_file} {m_type}"
+                if _WATCHLIST_RE.search(watch_text):
+                    watch_candidates[matter_url] = {
+                        "mid": m_id, "mfile": m_file, "mtype": m_type,
+                        "title": (m_name or m_title)[:500], "body": m_body,
+                        "status": m_status, "url": matter_url,
+                        "reason": f"Auto-detected: matched watchlist keywords in '{m_type}: {m_file}'"
+                    }
 
             except Exception as e:
                 logging.error(f"Matter {matter.get('MatterId')} error: {e}")
                 continue
 
+        # ── One atomic multi-VALUES upsert; the unique url index makes it
+        # race-free and RETURNING tells us which rows were actually new ──
+        inserted_urls = set()
+        if candidates:
+            rows = [{
+                "title": c["title"], "url": c["url"], "content": c["content"],
+                "source": "PG County Legistar", "discovered_date": scan_time,
+                "analyzed": False,
+            } for c in candidates]
+            stmt = pg_insert(articles_table).values(rows).on_conflict_do_nothing(
+                index_elements=["url"]
+            ).returning(articles_table.c.url)
+            inserted_urls = {u for (u,) in db.execute(stmt)}
+            new_articles = len(inserted_urls)
+
+        # Detail pages are fetched only for rows that turned out new —
+        # concurrently, since each is an independent blocking GET — then
+        # folded in with one batched UPDATE
+        to_detail = []
+        for cand in candidates:
+            if cand["url"] not in inserted_urls:
+                continue
+            if cand["log"]:
+                logging.info(cand["log"])
+            if cand["needs_detail"]:
+                to_detail.append(cand)
+        detail_updates = []
+        if to_detail:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                details = pool.map(
+                    scrape_article_content, [c["url"] for c in to_detail])
+            for cand, detail in zip(to_detail, details):
+                if detail:
+                    detail_updates.append({
+                        "url": cand["url"],
+                        "content": f"{cand['content']}\n\n{detail}",
+                    })
+        if detail_updates:
+            db.execute(_UPDATE_CONTENT_BY_URL, detail_updates)
+
+        # Watchlist inserts only for matters that were actually new. One
+        # SELECT loads the known matter ids into a set for the membership
+        # test — an exact in-memory pre-check instead of a round trip per
+        # candidate (the table is small enough not to need a Bloom filter).
+        watched_ids = set()
+        if watch_candidates:
+            watched_ids = {
+                row[0] for row in
+                db.execute(text("SELECT matter_id FROM watched_matters"))
+            }
+        for matter_url, watch_params in watch_candidates.items():
+            if matter_url not in inserted_urls:
+                continue
+            if watch_params["mid"] not in watched_ids:
+                try:
+                    db.execute(_INSERT_WATCHED_MATTER, watch_params)
+                    logging.info(
+                        f"Auto-watched matter {watch_params['mid']}: "
+                        f"{watch_params['mfile']} - {watch_params['title'][:60]}"
+                    )
+                except Exception as ew:
+                    logging.warning(f"Could not auto-watch matter {watch_params['mid']}: {ew}")
+
         db.commit()
         db.close()
         logging.info(f'Legistar API scraper completed. New articles: {new_articles}')
 
     except Exception as e:
         logging.error(f'Legistar API scraper error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
 
 
 @app.function_name(name="RSSNewsScraper")
@@ -431,63 +669,143 @@ def rss_news_scraper(timer: func.TimerRequest) -> None:
     
     try:
         db = SessionLocal()
+        # One timestamp per run — rows from the same scan share a
+        # discovered_date and the syscall stays out of the per-row path
+        scan_time = datetime.now()
         new_articles = 0
-        
-        for feed_url, source in rss_feeds:
+
+        # Collect keyword-matching entries from every feed first, check all
+        # their URLs against the DB in one query, then scrape/insert only
+        # the new ones — one existence query and one INSERT batch per run
+        # instead of a round-trip pair per entry.
+        candidates = []
+        candidate_urls = set()
+
+        # Conditional-GET state: pass each feed's stored ETag/Last-Modified
+        # so unchanged feeds come back as a bodyless 304.
+        feed_state = {
+            row.feed_url: (row.etag, row.last_modified)
+            for row in db.execute(feed_state_table.select())
+        }
+
+        # Fetch+parse all feeds concurrently — feedparser blocks on urllib,
+        # so sequential runs cost the sum of every feed's latency; a thread
+        # pool makes it roughly the slowest single feed instead.
+        def _fetch(feed_spec):
+            feed_url, source = feed_spec
+            etag, modified = feed_state.get(feed_url, (None, None))
+            try:
+                return feed_url, source, feedparser.parse(feed_url, etag=etag, modified=modified)
+            except Exception as e:
+                logging.error(f"Error fetching {source}: {e}")
+                return feed_url, source, None
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parsed_feeds = list(pool.map(_fetch, rss_feeds))
+
+        state_updates = []
+        for feed_url, source, feed in parsed_feeds:
+            if feed is None:
+                continue
+            if getattr(feed, 'status', None) == 304:
+                logging.info(f"Feed unchanged (304): {source}")
+                continue
+            new_etag = feed.get('etag')
+            new_modified = feed.get('modified')
+            if new_etag or new_modified:
+                state_updates.append({
+                    "feed_url": feed_url,
+                    "etag": new_etag,
+                    "last_modified": new_modified,
+                })
             try:
-                feed = feedparser.parse(feed_url)
-                
                 for entry in feed.entries[:20]:  # Limit entries per feed
                     title = entry.get('title', '')
                     url = entry.get('link', '')
                     summary = entry.get('summary', '')
-                    
+
+                    # Cheapest rejection first: the set lookup prunes dupes
+                    # before the keyword regexes run
+                    if not url or url in candidate_urls:
+                        continue
+
                     # Tiered keyword filter: global/regional feeds require geographic match
                     if not passes_keyword_filter(title, summary, feed_url):
                         continue
-                    
-                    # Check if already exists
-                    existing = db.execute(
-                        text("SELECT 1 FROM articles WHERE url = :url"),
-                        {"url": url}
-                    ).first()
-                    
-                    if not existing:
-                        published = entry.get('published_parsed')
-                        pub_date = datetime(*published[:6]) if published else None
-                        
-                        # Scrape full article content
-                        full_content = scrape_article_content(url)
-                        
-                        db.execute(
-                            text("""
-                            INSERT INTO articles (title, url, summary, content, source, published_date, discovered_date, analyzed)
-                            VALUES (:title, :url, :summary, :content, :source, :published, :discovered, FALSE)
-                            """),
-                            {
-                                "title": title[:500],
-                                "url": url,
-                                "summary": summary,
-                                "content": full_content or summary,
-                                "source": source,
-                                "published": pub_date,
-                                "discovered": datetime.now()
-                            }
-                        )
-                        new_articles += 1
-                        logging.info(f"New article from {source}: {title[:80]}")
-            
+
+                    published = entry.get('published_parsed')
+                    pub_date = datetime(*published[:6]) if published else None
+
+                    candidates.append({
+                        "title": title[:500],
+                        "url": url,
+                        "summary": summary,
+                        "source": source,
+                        "published": pub_date,
+                    })
+                    candidate_urls.add(url)
+
             except Exception as e:
                 logging.error(f"Error scraping {source}: {e}")
                 continue
-        
+
+        # One atomic multi-VALUES upsert (summary as placeholder content);
+        # RETURNING identifies the genuinely new rows so full content is
+        # scraped only for those, then applied with one batched UPDATE
+        inserted_urls = set()
+        if candidates:
+            rows = [{
+                "title": c["title"], "url": c["url"], "summary": c["summary"],
+                "content": c["summary"], "source": c["source"],
+                "published_date": c["published"], "discovered_date": scan_time,
+                "analyzed": False,
+            } for c in candidates]
+            stmt = pg_insert(articles_table).values(rows).on_conflict_do_nothing(
+                index_elements=["url"]
+            ).returning(articles_table.c.url)
+            inserted_urls = {u for (u,) in db.execute(stmt)}
+            new_articles = len(inserted_urls)
+
+        # Full content for the new rows is fetched concurrently — the GETs
+        # release the GIL on socket waits — then applied in one batch
+        new_cands = [c for c in candidates if c["url"] in inserted_urls]
+        content_updates = []
+        if new_cands:
+            for cand in new_cands:
+                logging.info(f"New article from {cand['source']}: {cand['title'][:80]}")
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                contents = pool.map(
+                    scrape_article_content, [c["url"] for c in new_cands])
+            for cand, full_content in zip(new_cands, contents):
+                if full_content:
+                    content_updates.append({"url": cand["url"], "content": full_content})
+        if content_updates:
+            db.execute(_UPDATE_CONTENT_BY_URL, content_updates)
+
+        # Persist the new validators in one batch for next run's
+        # conditional GETs
+        if state_updates:
+            stmt = pg_insert(feed_state_table).values(state_updates)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["feed_url"],
+                set_={"etag": stmt.excluded.etag,
+                      "last_modified": stmt.excluded.last_modified},
+            ))
+
         db.commit()
         db.close()
-        
+
         logging.info(f'RSS scraper completed. New articles: {new_articles}')
     
     except Exception as e:
         logging.error(f'RSS scraper error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
 
 
 @app.function_name(name="PlanningBoardScraper")
@@ -516,8 +834,17 @@ def planning_board_scraper(timer: func.TimerRequest) -> None:
 
     try:
         db = SessionLocal()
+        # One timestamp per run — rows from the same scan share a
+        # discovered_date and the syscall stays out of the per-row path
+        scan_time = datetime.now()
         new_articles = 0
 
+        # Candidates from both sections are collected first, checked
+        # against the DB in one query, and only then scraped/inserted —
+        # one existence round trip per run instead of one per link
+        pb_candidates = []
+        pb_seen = set()
+
         # ── 1. News / press-release listing pages ────────────────────
         listing_pages = [
             (f"{PB_BASE}/news/", "PG Planning Board"),
@@ -526,16 +853,14 @@ def planning_board_scraper(timer: func.TimerRequest) -> None:
 
         for page_url, source_label in listing_pages:
             try:
-                resp = requests.get(page_url, timeout=30, headers=BROWSER_HEADERS)
+                resp = HTTP.get(page_url, timeout=30, headers=BROWSER_HEADERS)
                 resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                soup = BeautifulSoup(resp.content, _SOUP_PARSER)
 
                 # WordPress themes wrap posts in <article> or div.post-*
                 post_elems = (
                     soup.find_all('article')
-                    or soup.find_all('div', class_=lambda c: c and any(
-                        x in str(c) for x in ['post', 'entry', 'news-item']
-                    ))
+                    or soup.find_all('div', class_=_POST_CLASS_RE)
                 )
 
                 # Fallback: unique article-like links
@@ -566,25 +891,18 @@ def planning_board_scraper(timer: func.TimerRequest) -> None:
 
                         excerpt_tag = elem.find('p')
                         excerpt = excerpt_tag.get_text(strip=True) if excerpt_tag else ""
-                        combined = f"{title} {excerpt}".lower()
-                        if not any(kw.lower() in combined for kw in SCRAPER_KEYWORDS):
+                        if not _SCRAPER_KW_RE.search(f"{title} {excerpt}"):
                             continue
 
-                        if db.execute(text("SELECT 1 FROM articles WHERE url = :url"), {"url": href}).first():
+                        if href in pb_seen:
                             continue
-
-                        full_content = scrape_article_content(href)
-                        db.execute(
-                            text("""
-                            INSERT INTO articles (title, url, content, source, discovered_date, analyzed)
-                            VALUES (:title, :url, :content, :source, :discovered, FALSE)
-                            """),
-                            {"title": title[:500], "url": href,
-                             "content": full_content or title,
-                             "source": source_label, "discovered": datetime.now()},
-                        )
-                        new_articles += 1
-                        logging.info(f"New PB article: {title[:80]}")
+                        pb_seen.add(href)
+                        pb_candidates.append({
+                            "title": title[:500], "url": href,
+                            "source": source_label, "scrape": True,
+                            "fallback": title,
+                            "log": f"New PB article: {title[:80]}",
+                        })
 
                     except Exception as e:
                         logging.error(f"PB article element error: {e}")
@@ -596,54 +914,84 @@ def planning_board_scraper(timer: func.TimerRequest) -> None:
 
         # ── 2. Meetings page — agendas & minutes ─────────────────────
         try:
-            resp = requests.get(f"{PB_BASE}/meetings/", timeout=30, headers=BROWSER_HEADERS)
+            resp = HTTP.get(f"{PB_BASE}/meetings/", timeout=30, headers=BROWSER_HEADERS)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            soup = BeautifulSoup(resp.content, _SOUP_PARSER)
 
             for a_tag in soup.find_all('a', href=True):
                 href = a_tag['href']
                 link_text = a_tag.get_text(strip=True)
 
-                if not any(t in link_text.lower() for t in ['agenda', 'minutes', 'meeting']):
+                if not _AGENDA_LINK_RE.search(link_text.lower()):
                     if not href.endswith('.pdf'):
                         continue
 
-                combined = f"{link_text} {a_tag.get('title', '')}".lower()
-                if not any(kw.lower() in combined for kw in SCRAPER_KEYWORDS):
+                if not _SCRAPER_KW_RE.search(f"{link_text} {a_tag.get('title', '')}"):
                     continue
 
                 if not href.startswith('http'):
                     href = f"{PB_BASE}{href}"
 
-                if db.execute(text("SELECT 1 FROM articles WHERE url = :url"), {"url": href}).first():
+                if href in pb_seen:
                     continue
-
+                pb_seen.add(href)
                 title = f"[PB Agenda] {link_text}"
-                content = ""
-                if not href.endswith('.pdf'):
-                    content = scrape_article_content(href)
-
-                db.execute(
-                    text("""
-                    INSERT INTO articles (title, url, content, source, discovered_date, analyzed)
-                    VALUES (:title, :url, :content, :source, :discovered, FALSE)
-                    """),
-                    {"title": title[:500], "url": href,
-                     "content": content or link_text,
-                     "source": "PG Planning Board Agenda", "discovered": datetime.now()},
-                )
-                new_articles += 1
-                logging.info(f"New PB agenda: {title[:80]}")
+                pb_candidates.append({
+                    "title": title[:500], "url": href,
+                    "source": "PG Planning Board Agenda",
+                    "scrape": not href.endswith('.pdf'),
+                    "fallback": link_text,
+                    "log": f"New PB agenda: {title[:80]}",
+                })
 
         except Exception as e:
             logging.error(f"Meetings page error: {e}")
 
+        # One existence query for every candidate URL, then scrape and
+        # insert only the new ones
+        if pb_candidates:
+            existing = {
+                row[0] for row in db.execute(
+                    _Q_ARTICLES_BY_URLS,
+                    {"urls": [c["url"] for c in pb_candidates]},
+                )
+            }
+            new_rows = []
+            for c in pb_candidates:
+                if c["url"] in existing:
+                    continue
+                content = scrape_article_content(c["url"]) if c["scrape"] else ""
+                new_rows.append({
+                    "title": c["title"], "url": c["url"],
+                    "content": content or c["fallback"],
+                    "source": c["source"], "discovered_date": scan_time,
+                    "analyzed": False,
+                })
+                logging.info(c["log"])
+            if new_rows:
+                # Single multi-VALUES insert; ON CONFLICT covers the race
+                # window between the existence check and this statement
+                result = db.execute(
+                    pg_insert(articles_table)
+                    .values(new_rows)
+                    .on_conflict_do_nothing(index_elements=["url"])
+                    .returning(articles_table.c.id)
+                )
+                new_articles = len(result.fetchall())
+
         db.commit()
         db.close()
         logging.info(f'Planning Board scraper completed. New articles: {new_articles}')
 
     except Exception as e:
         logging.error(f'Planning Board scraper error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
 
 
 # ── Amendment Watchlist Tracker ──────────────────────────────────────────────
@@ -669,6 +1017,9 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
 
     try:
         db = SessionLocal()
+        # One timestamp per run — rows from the same scan share a
+        # discovered_date and the syscall stays out of the per-row path
+        scan_time = datetime.now()
 
         # Get all active watched matters
         watched = db.execute(
@@ -694,7 +1045,7 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
 
             # ── 1. Histories (status transitions) ────────────────────
             try:
-                resp = requests.get(
+                resp = HTTP.get(
                     f"{LEGISTAR_BASE}/matters/{mid}/histories",
                     headers=API_HEADERS,
                     timeout=20,
@@ -714,10 +1065,7 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                     continue
 
                 # Dedup check
-                exists = db.execute(
-                    text("SELECT 1 FROM matter_histories WHERE legistar_history_id = :hid"),
-                    {"hid": hist_id}
-                ).first()
+                exists = db.execute(_Q_HISTORY_EXISTS, {"hid": hist_id}).first()
                 if exists:
                     continue
 
@@ -744,22 +1092,14 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                 new_status = action_text or result_text or prev_status
 
                 db.execute(
-                    text("""
-                    INSERT INTO matter_histories
-                        (matter_id, legistar_history_id, action_date, action_text,
-                         action_body, result, vote_info, minutes_note,
-                         previous_status, new_status, is_milestone, notified, discovered_date)
-                    VALUES (:mid, :hid, :adate, :atext,
-                            :abody, :result, :vinfo, :mnote,
-                            :pstatus, :nstatus, :milestone, FALSE, :now)
-                    """),
+                    _INSERT_MATTER_HISTORY,
                     {
                         "mid": mid, "hid": hist_id, "adate": action_date,
                         "atext": action_text[:500], "abody": action_body[:200],
                         "result": result_text[:100], "vinfo": vote_info[:200],
                         "mnote": minutes_note,
                         "pstatus": prev_status[:200], "nstatus": new_status[:200],
-                        "milestone": is_milestone, "now": datetime.now(),
+                        "milestone": is_milestone, "now": scan_time,
                     },
                 )
                 new_histories += 1
@@ -781,14 +1121,14 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                     SET current_status = :status, last_action_date = :adate, updated_date = :now
                     WHERE matter_id = :mid
                     """),
-                    {"status": latest_status[:200], "adate": latest_action_date, "now": datetime.now(), "mid": mid},
+                    {"status": latest_status[:200], "adate": latest_action_date, "now": scan_time, "mid": mid},
                 )
                 status_changes += 1
                 logging.info(f"Status change for matter {mid}: '{prev_status}' → '{latest_status}'")
 
             # ── 2. Attachments (draft text, staff reports) ───────────
             try:
-                resp = requests.get(
+                resp = HTTP.get(
                     f"{LEGISTAR_BASE}/matters/{mid}/attachments",
                     headers=API_HEADERS,
                     timeout=20,
@@ -804,10 +1144,7 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                 if not att_id:
                     continue
 
-                exists = db.execute(
-                    text("SELECT 1 FROM matter_attachments WHERE legistar_attachment_id = :aid"),
-                    {"aid": att_id}
-                ).first()
+                exists = db.execute(_Q_ATTACHMENT_EXISTS, {"aid": att_id}).first()
                 if exists:
                     continue
 
@@ -822,17 +1159,11 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                     content_text = scrape_article_content(att_link)
 
                 db.execute(
-                    text("""
-                    INSERT INTO matter_attachments
-                        (matter_id, legistar_attachment_id, name, hyperlink,
-                         file_type, content_text, analyzed, notified, discovered_date)
-                    VALUES (:mid, :aid, :name, :link,
-                            :ftype, :content, FALSE, FALSE, :now)
-                    """),
+                    _INSERT_MATTER_ATTACHMENT,
                     {
                         "mid": mid, "aid": att_id, "name": att_name[:500],
                         "link": att_link, "ftype": file_ext[:50],
-                        "content": content_text, "now": datetime.now(),
+                        "content": content_text, "now": scan_time,
                     },
                 )
                 new_attachments += 1
@@ -840,7 +1171,7 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
 
             # ── 3. Votes (roll calls) ────────────────────────────────
             try:
-                resp = requests.get(
+                resp = HTTP.get(
                     f"{LEGISTAR_BASE}/matters/{mid}/votes",
                     headers=API_HEADERS,
                     timeout=20,
@@ -856,10 +1187,7 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                 if not vote_id:
                     continue
 
-                exists = db.execute(
-                    text("SELECT 1 FROM matter_votes WHERE legistar_vote_id = :vid"),
-                    {"vid": vote_id}
-                ).first()
+                exists = db.execute(_Q_VOTE_EXISTS, {"vid": vote_id}).first()
                 if exists:
                     continue
 
@@ -882,19 +1210,13 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
                 roll_call_entry = [{"person": person_name, "vote": vote_value}] if person_name else []
 
                 db.execute(
-                    text("""
-                    INSERT INTO matter_votes
-                        (matter_id, legistar_vote_id, vote_date, body_name,
-                         result, tally, roll_call, notified, discovered_date)
-                    VALUES (:mid, :vid, :vdate, :body,
-                            :result, :tally, :roll_call, FALSE, :now)
-                    """),
+                    _INSERT_MATTER_VOTE,
                     {
                         "mid": mid, "vid": vote_id, "vdate": vote_date,
                         "body": body_name[:200], "result": result_text[:100],
                         "tally": tally[:50],
                         "roll_call": json.dumps(roll_call_entry),
-                        "now": datetime.now(),
+                        "now": scan_time,
                     },
                 )
                 new_votes += 1
@@ -913,41 +1235,26 @@ def amendment_watchlist_tracker(timer: func.TimerRequest) -> None:
 
     except Exception as e:
         logging.error(f'Amendment Watchlist Tracker error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
 
 
-@app.function_name(name="ArticleAnalyzer")
-@app.schedule(schedule="0 */10 * * * *", arg_name="timer", run_on_startup=False)
-def article_analyzer(timer: func.TimerRequest) -> None:
-    """Analyze unanalyzed articles every 10 minutes"""
-    
-    logging.info('Article analyzer function started')
-    
-    try:
-        from anthropic import Anthropic
-        
-        client = Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-        db = SessionLocal()
-        
-        # Get unanalyzed articles
-        articles = db.execute(
-            text("""
-            SELECT id, title, summary, content, source
-            FROM articles
-            WHERE analyzed = FALSE
-            LIMIT 5
-            """)
-        ).fetchall()
-        
-        for article in articles:
-            try:
-                content = f"{article[1]} {article[2] or ''} {article[3] or ''}"
-                # Use more content for better analysis (up to 3000 chars)
-                content = content[:3000]
-                
-                prompt = f"""You are a classification engine for the Eagle Harbor Data Center Monitor,
+# Shared classification rubric for ArticleAnalyzer. Kept as a standalone
+# system block marked for Anthropic prompt caching: the rubric prefix is
+# identical across invocations, so the API reuses its cached encoding and
+# only the per-batch article payload is processed fresh.
+_ANALYSIS_RUBRIC = """You are a classification engine for the Eagle Harbor Data Center Monitor,
 which tracks data center developments in Prince George's County and Charles County, Maryland.
 
-Analyze the article below and return a JSON object with these fields:
+Analyze EACH article in the JSON array provided by the user and return a JSON array with one
+object per input article, each containing these fields:
+
+0. "id" (integer): The id of the input article this result belongs to.
 
 1. "relevance_score" (integer 0-10): How relevant is this to Maryland data center developments?
    - 8-10: Directly about data centers in Prince George's County or Charles County, MD
@@ -974,72 +1281,118 @@ Analyze the article below and return a JSON object with these fields:
 
 6. "key_points": Array of 2-4 key takeaways relevant to PG/Charles County stakeholders.
 
-Article to analyze:
-Title: {article[1]}
-Source: {article[4]}
-Content: {content}
+Return ONLY a valid JSON array, no markdown formatting."""
 
-Return ONLY valid JSON, no markdown formatting."""
+# Built once per worker rather than per timer firing — the SDK's HTTP
+# client keeps a keep-alive pool, so later analyzer runs reuse the same
+# TCP+TLS connection instead of handshaking each time. Lazy so workers
+# without ANTHROPIC_API_KEY (or the package) still import cleanly.
+_anthropic_client = None
+
+
+def _get_anthropic_client():
+    global _anthropic_client
+    if _anthropic_client is None:
+        from anthropic import Anthropic
+        _anthropic_client = Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+    return _anthropic_client
+
+
+@app.function_name(name="ArticleAnalyzer")
+@app.schedule(schedule="0 */10 * * * *", arg_name="timer", run_on_startup=False)
+def article_analyzer(timer: func.TimerRequest) -> None:
+    """Analyze unanalyzed articles every 10 minutes"""
+    
+    logging.info('Article analyzer function started')
+    
+    try:
+        client = _get_anthropic_client()
+        db = SessionLocal()
+        
+        # Get unanalyzed articles
+        articles = db.execute(_SELECT_UNANALYZED, {"n": 5}).fetchall()
+        
+        if not articles:
+            db.close()
+            logging.info('Article analyzer completed. Analyzed: 0')
+            return
+
+        # One batched request for the whole set instead of an API round-trip
+        # per article — the shared rubric is processed once and total wall
+        # time drops to a single call's latency.
+        batch_payload = []
+        for article in articles:
+            content = f"{article[1]} {article[2] or ''} {article[3] or ''}"
+            # Use more content for better analysis (up to 3000 chars)
+            batch_payload.append({
+                "id": article[0],
+                "title": article[1],
+                "source": article[4],
+                "content": content[:3000],
+            })
+
+        analyzed_ids = set()
+        updates = []
+        try:
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=4096,
+                system=[{
+                    "type": "text",
+                    "text": _ANALYSIS_RUBRIC,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+                messages=[{
+                    "role": "user",
+                    "content": f"Articles to analyze:\n{json.dumps(batch_payload)}",
+                }]
+            )
+
+            raw_text = response.content[0].text.strip()
+            # Strip markdown code fences if present
+            if raw_text.startswith('```'):
+                raw_text = raw_text.split('\n', 1)[1] if '\n' in raw_text else raw_text[3:]
+                if raw_text.endswith('```'):
+                    raw_text = raw_text[:-3].strip()
+
+            valid_ids = {article[0] for article in articles}
+            for analysis in (orjson.loads(raw_text) if orjson else json.loads(raw_text)):
+                article_id = analysis.get('id')
+                if article_id not in valid_ids:
+                    continue
 
-                response = client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=1024,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
-                raw_text = response.content[0].text.strip()
-                # Strip markdown code fences if present
-                if raw_text.startswith('```'):
-                    raw_text = raw_text.split('\n', 1)[1] if '\n' in raw_text else raw_text[3:]
-                    if raw_text.endswith('```'):
-                        raw_text = raw_text[:-3].strip()
-                
-                analysis = json.loads(raw_text)
-                
                 relevance = analysis.get('relevance_score', 0)
                 priority = analysis.get('priority_score', 5)
-                category = analysis.get('category', 'general')
                 county = analysis.get('county', 'unclear')
-                summary = analysis.get('summary', '')
-                
-                db.execute(
-                    text("""
-                    UPDATE articles
-                    SET relevance_score = :relevance,
-                        priority_score = :priority,
-                        category = :category,
-                        county = :county,
-                        summary = CASE WHEN :summary != '' THEN :summary ELSE summary END,
-                        analyzed = TRUE
-                    WHERE id = :id
-                    """),
-                    {
-                        "id": article[0],
-                        "relevance": min(max(int(relevance), 0), 10),
-                        "priority": min(max(int(priority), 1), 10),
-                        "category": category,
-                        "county": county,
-                        "summary": (summary or '')[:2000],
-                    }
-                )
-                
+
+                updates.append({
+                    "id": article_id,
+                    "relevance": min(max(int(relevance), 0), 10),
+                    "priority": min(max(int(priority), 1), 10),
+                    "category": analysis.get('category', 'general'),
+                    "county": county,
+                    "summary": (analysis.get('summary') or '')[:2000],
+                })
+                analyzed_ids.add(article_id)
+
                 logging.info(
-                    f"Analyzed article {article[0]}: relevance={relevance}, "
+                    f"Analyzed article {article_id}: relevance={relevance}, "
                     f"priority={priority}, county={county}"
                 )
-            
-            except Exception as e:
-                logging.error(f"Error analyzing article {article[0]}: {e}")
-                # Mark as analyzed with low relevance so it doesn't block the queue
-                db.execute(
-                    text("""
-                    UPDATE articles
-                    SET analyzed = TRUE, relevance_score = 0
-                    WHERE id = :id
-                    """),
-                    {"id": article[0]}
-                )
-        
+
+        except Exception as e:
+            logging.error(f"Error analyzing article batch: {e}")
+
+        if updates:
+            # Single executemany round-trip for all analyzed rows
+            db.execute(_UPDATE_ANALYSIS, updates)
+
+        # Mark anything the batch failed to cover as analyzed with low
+        # relevance so it doesn't block the queue
+        missed = [{"id": article[0]} for article in articles if article[0] not in analyzed_ids]
+        if missed:
+            db.execute(_MARK_ANALYZED, missed)
+
         db.commit()
         db.close()
         
@@ -1047,6 +1400,13 @@ Return ONLY valid JSON, no markdown formatting."""
     
     except Exception as e:
         logging.error(f'Article analyzer error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
 
 
 @app.function_name(name="HistoricalScan")
@@ -1097,7 +1457,14 @@ def historical_scan(req: func.HttpRequest) -> func.HttpResponse:
         ]
         
         db = SessionLocal()
+        # One timestamp per run — rows from the same scan share a
+        # discovered_date and the syscall stays out of the per-row path
+        scan_time = datetime.now()
         
+        # Syndicated stories repeat across these feeds — a run-wide set
+        # drops repeats before they reach the batched existence check
+        seen_urls = set()
+        candidates = []
         for feed_url, source in rss_feeds:
             try:
                 feed = feedparser.parse(feed_url)
@@ -1116,40 +1483,21 @@ def historical_scan(req: func.HttpRequest) -> func.HttpResponse:
                         url = entry.get('link', '')
                         summary = entry.get('summary', entry.get('description', ''))
                         
-                        # Use tiered keyword filter (same logic as RSSNewsScraper)
-                        if not passes_keyword_filter(title, summary, feed_url):
+                        if not url or url in seen_urls:
                             continue
+                        seen_urls.add(url)
                         
-                        # Check if exists
-                        existing = db.execute(
-                            text("SELECT id FROM articles WHERE url = :url"),
-                            {"url": url}
-                        ).fetchone()
-                        
-                        if existing:
+                        # Use tiered keyword filter (same logic as RSSNewsScraper)
+                        if not passes_keyword_filter(title, summary, feed_url):
                             continue
                         
-                        # Scrape full article content
-                        full_content = scrape_article_content(url)
-                        
-                        # Insert new article
-                        db.execute(
-                            text("""
-                                INSERT INTO articles 
-                                (title, url, content, source, discovered_date, published_date, analyzed)
-                                VALUES (:title, :url, :content, :source, :discovered, :published, FALSE)
-                            """),
-                            {
-                                "title": title,
-                                "url": url,
-                                "content": full_content or summary,
-                                "source": source,
-                                "discovered": datetime.now(),
-                                "published": pub_date or datetime.now()
-                            }
-                        )
-                        articles_found += 1
-                        logging.info(f"Historical: {title[:60]}")
+                        candidates.append({
+                            "title": title,
+                            "url": url,
+                            "summary": summary,
+                            "source": source,
+                            "published": pub_date,
+                        })
                     
                     except Exception as e:
                         logging.error(f"Entry error: {e}")
@@ -1159,6 +1507,42 @@ def historical_scan(req: func.HttpRequest) -> func.HttpResponse:
                 logging.error(f"Feed error for {source}: {e}")
                 continue
         
+        # One existence query for the whole run instead of one per entry,
+        # then scrape and insert only the genuinely new URLs in one batch
+        if candidates:
+            existing = {
+                row[0] for row in db.execute(
+                    _Q_ARTICLES_BY_URLS,
+                    {"urls": [c["url"] for c in candidates]},
+                )
+            }
+            new_rows = []
+            for c in candidates:
+                if c["url"] in existing:
+                    continue
+                full_content = scrape_article_content(c["url"])
+                new_rows.append({
+                    "title": c["title"],
+                    "url": c["url"],
+                    "content": full_content or c["summary"],
+                    "source": c["source"],
+                    "discovered_date": scan_time,
+                    "published_date": c["published"] or scan_time,
+                    "analyzed": False,
+                })
+                logging.info(f"Historical: {c['title'][:60]}")
+            if new_rows:
+                # ON CONFLICT covers the window between the existence probe
+                # and this insert — RSSNewsScraper works the same feeds on a
+                # timer, and a URL it lands first must not abort the batch
+                result = db.execute(
+                    pg_insert(articles_table)
+                    .values(new_rows)
+                    .on_conflict_do_nothing(index_elements=["url"])
+                    .returning(articles_table.c.id)
+                )
+                articles_found = len(result.fetchall())
+        
         db.commit()
         db.close()
         
@@ -1173,15 +1557,22 @@ def historical_scan(req: func.HttpRequest) -> func.HttpResponse:
         logging.info(f'Historical scan complete: {articles_found} articles')
         
         return func.HttpResponse(
-            json.dumps(result),
+            orjson.dumps(result) if orjson else json.dumps(result),
             mimetype="application/json",
             status_code=200
         )
     
     except Exception as e:
         logging.error(f'Historical scan error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
         return func.HttpResponse(
-            json.dumps({"error": str(e)}),
+            orjson.dumps({"error": str(e)}) if orjson else json.dumps({"error": str(e)}),
             mimetype="application/json",
             status_code=500
         )
@@ -1279,19 +1670,19 @@ def instant_alert_sender(timer: func.TimerRequest) -> None:
                             logging.error(f"Email send error for {email_addr}: {se}")
 
                     db.execute(
-                        text("UPDATE articles SET notified = TRUE WHERE id = :id"),
+                        _MARK_ARTICLE_NOTIFIED,
                         {"id": art_id}
                     )
                 else:
                     logging.warning("Azure Comm Services not configured — skipping email send")
                     db.execute(
-                        text("UPDATE articles SET notified = TRUE WHERE id = :id"),
+                        _MARK_ARTICLE_NOTIFIED,
                         {"id": art_id}
                     )
             except ImportError:
                 logging.warning("azure-communication-email not installed — skipping email send")
                 db.execute(
-                    text("UPDATE articles SET notified = TRUE WHERE id = :id"),
+                    _MARK_ARTICLE_NOTIFIED,
                     {"id": art_id}
                 )
 
@@ -1359,7 +1750,7 @@ def instant_alert_sender(timer: func.TimerRequest) -> None:
                     logging.warning(f"Could not send watchlist email: {ex}")
 
                 db.execute(
-                    text("UPDATE matter_histories SET notified = TRUE WHERE id = :id"),
+                    _MARK_HISTORY_NOTIFIED,
                     {"id": ms_id}
                 )
 
@@ -1382,7 +1773,7 @@ def instant_alert_sender(timer: func.TimerRequest) -> None:
             for att in new_atts:
                 att_id = att[0]
                 db.execute(
-                    text("UPDATE matter_attachments SET notified = TRUE WHERE id = :id"),
+                    _MARK_ATTACHMENT_NOTIFIED,
                     {"id": att_id}
                 )
 
@@ -1395,6 +1786,13 @@ def instant_alert_sender(timer: func.TimerRequest) -> None:
 
     except Exception as e:
         logging.error(f'Instant Alert Sender error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass
 
 
 # ── Weekly Digest Sender ─────────────────────────────────────────────────────
@@ -1596,3 +1994,10 @@ def weekly_digest_sender(timer: func.TimerRequest) -> None:
 
     except Exception as e:
         logging.error(f'Weekly Digest error: {str(e)}')
+        # Return the connection to the pool even on failure — otherwise
+        # the session leaks on warm workers until GC gets to it
+        try:
+            db.rollback()
+            db.close()
+        except Exception:
+            pass